@@ -54,6 +54,11 @@ class CursorCloudAPI:
         self.session = requests.Session()
         self.session.auth = (api_key, "")  # Basic Auth: key as username, empty password
         self.session.headers.update({"Content-Type": "application/json"})
+        # agent_id -> (ETag, messages) of the last conversation response,
+        # used for conditional GETs while polling.  Only the list is copied
+        # per call: the message dicts are shared with callers, so mutating
+        # them would change what later 304 replies return.
+        self._conversations: dict[str, tuple[str, tuple[dict, ...]]] = {}
 
     def _request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
         """HTTP request with retry and exponential backoff.
@@ -137,9 +142,25 @@ class CursorCloudAPI:
         return self._request("GET", f"{self.BASE}/agents/{agent_id}").json()
 
     def get_conversation(self, agent_id: str) -> list[dict]:
-        """Retrieve the full conversation history for an agent."""
-        r = self._request("GET", f"{self.BASE}/agents/{agent_id}/conversation")
-        return r.json().get("messages", [])
+        """Retrieve the full conversation history for an agent.
+
+        When the previous response carried an ``ETag``, the request is
+        made conditional with ``If-None-Match`` and a ``304 Not Modified``
+        reply reuses the cached messages, so polling an unchanged
+        transcript does not re-download it.
+        """
+        cached = self._conversations.get(agent_id)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        r = self._request(
+            "GET", f"{self.BASE}/agents/{agent_id}/conversation", headers=headers
+        )
+        if r.status_code == 304 and cached:
+            return list(cached[1])
+        messages = r.json().get("messages", [])
+        etag = r.headers.get("ETag")
+        if etag:
+            self._conversations[agent_id] = (etag, tuple(messages))
+        return messages
 
     def stop(self, agent_id: str) -> dict:
         """Stop a running agent (can be resumed with a follow-up)."""
@@ -206,20 +227,26 @@ def wait_for_all_agents(
     agents: dict[str, str],
     timeout: int = AGENT_POLL_TIMEOUT,
     poll_interval: int = 10,
-) -> None:
+) -> dict[str, dict]:
     """Poll multiple agents concurrently until all are FINISHED.
 
     Use this for initial agent launches.  For follow-ups, use
     :func:`wait_for_all_followups` instead.
+
+    Returns the final ``status()`` payload of each agent, keyed like
+    *agents*, so callers can read e.g. the branch name without another
+    request.
     """
     start = time.time()
     remaining = dict(agents)
+    finished: dict[str, dict] = {}
     while remaining and time.time() - start < timeout:
         for alias, agent_id in list(remaining.items()):
             info = api.status(agent_id)
             status = info["status"]
             if status == "FINISHED":
                 remaining.pop(alias)
+                finished[alias] = info
                 logger.info("Agent %s (%s) finished", alias, agent_id)
             elif status not in ("CREATING", "RUNNING"):
                 raise RuntimeError(f"Agent {agent_id} in unexpected state: {status}")
@@ -228,6 +255,7 @@ def wait_for_all_agents(
             time.sleep(poll_interval)
     if remaining:
         raise TimeoutError(f"Agents {list(remaining)} did not finish within {timeout}s")
+    return finished
 
 
 # ---------------------------------------------------------------------------
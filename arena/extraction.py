@@ -14,6 +14,9 @@ from pydantic import BaseModel, Field
 
 logger = logging.getLogger("arena")
 
+# Matches ```json ... ``` or ``` ... ``` containing JSON
+_FENCED_JSON_RE = re.compile(r"```(?:json)?\s*\n(.*?)\n\s*```", re.DOTALL)
+
 
 # ---------------------------------------------------------------------------
 # Vote verdict model (JSON-based)
@@ -121,9 +124,7 @@ def parse_vote_verdict_json(
         pass
 
     # ── Fallback: extract from fenced code block ──
-    # Matches ```json ... ``` or ``` ... ``` containing JSON
-    pattern = r"```(?:json)?\s*\n(.*?)\n\s*```"
-    match = re.search(pattern, text, re.DOTALL)
+    match = _FENCED_JSON_RE.search(text)
     if match:
         try:
             data = json.loads(match.group(1))
@@ -11,6 +11,7 @@ transition.  :func:`run_orchestrator` is a convenience wrapper that loops
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
 import logging
@@ -23,6 +24,7 @@ from arena.state import (
     ArenaState,
     Phase,
     ProgressStatus,
+    _write_if_changed,
     load_state,
     sanitize_filename_component,
     save_state,
@@ -48,21 +50,40 @@ def next_arena_dir(root: str = ARENAS_ROOT) -> str:
     if needed.
     """
     _ensure_gitignore(root)
-    existing = sorted(
-        int(d) for d in (os.listdir(root) if os.path.isdir(root) else []) if d.isdigit()
-    )
-    next_num = (existing[-1] + 1) if existing else 1
+    latest = _latest_numbered_entry(root)
+    next_num = (latest[0] + 1) if latest else 1
     return os.path.join(root, f"{next_num:04d}")
 
 
 def latest_arena_dir(root: str = ARENAS_ROOT) -> str | None:
     """Return the most recent arena directory, or ``None`` if none exist."""
-    if not os.path.isdir(root):
+    latest = _latest_numbered_entry(root)
+    if latest is None:
         return None
-    numbered = sorted((int(d), d) for d in os.listdir(root) if d.isdigit())
-    if not numbered:
+    return os.path.join(root, latest[1])
+
+
+def _latest_numbered_entry(root: str) -> tuple[int, str] | None:
+    """Return ``(number, name)`` of the highest-numbered subdirectory of *root*.
+
+    Uses :func:`os.scandir` so the directory type comes from the cached
+    ``DirEntry`` rather than a separate ``stat`` per entry, and a single
+    ``max`` pass instead of sorting.  Returns ``None`` if *root* does not
+    exist or contains no numbered subdirectories.
+    """
+    try:
+        it = os.scandir(root)
+    except (FileNotFoundError, NotADirectoryError):
         return None
-    return os.path.join(root, numbered[-1][1])
+    with it:
+        return max(
+            (
+                (int(e.name), e.name)
+                for e in it
+                if e.name.isdigit() and e.is_dir(follow_symlinks=False)
+            ),
+            default=None,
+        )
 
 
 def arena_number_from_dir(arena_dir: str) -> int:
@@ -105,19 +126,49 @@ def _make_api() -> CursorCloudAPI:
     return CursorCloudAPI(api_key)
 
 
+@functools.lru_cache(maxsize=256)
 def _content_uid(content: str) -> str:
-    """Return a short deterministic UID from content (first 6 hex chars of SHA-256)."""
+    """Return a short deterministic UID from content (first 6 hex chars of SHA-256).
+
+    Memoized because :func:`update_report` recomputes archive filenames
+    for the same artifact strings once per round in ``verdict_history``.
+    """
     return hashlib.sha256(content.encode()).hexdigest()[:6]
 
 
-def _archive_artifact(arena_dir: str, name: str, content: str) -> None:
-    """Write an artifact file, skipping if it already exists (deduplication)."""
-    path = os.path.join(arena_dir, name)
-    if os.path.exists(path):
+def _archive_artifact(path: str, content: str) -> None:
+    """Write an artifact file, skipping if it already exists (deduplication).
+
+    The file is created with ``O_CREAT | O_EXCL`` so the existence check
+    and the create are one atomic syscall; ``FileExistsError`` is the
+    deduplication hit.  The parent directory is only created on demand.
+    Empty content (e.g. an agent that never committed its file) is not
+    archived at all.
+    """
+    if not content:
+        return
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL
+    try:
+        fd = os.open(path, flags, 0o644)
+    except FileExistsError:
         return
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w") as f:
-        f.write(content)
+    except FileNotFoundError:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        try:
+            fd = os.open(path, flags, 0o644)
+        except FileExistsError:
+            return
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+    except BaseException:
+        # Don't leave a truncated file behind: it would be treated as
+        # already archived on every later call.
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+        raise
 
 
 def _archive_round(state: ArenaState, arena_dir: str) -> None:
@@ -132,30 +183,30 @@ def _archive_round(state: ArenaState, arena_dir: str) -> None:
     """
     rnd = state.round
     gen_num = PHASE_NUMBERS["generate"]
+    eval_num = PHASE_NUMBERS["evaluate"]
+    # Joined once; each artifact path is then a plain concatenation.
+    prefix = os.path.join(arena_dir, "")
 
-    for alias in state.alias_mapping:
-        model = sanitize_filename_component(
-            str(state.alias_mapping.get(alias, "unknown"))
-        )
+    for alias, raw_model in state.alias_mapping.items():
+        model = sanitize_filename_component(str(raw_model))
 
         solution = state.solutions.get(alias)
         if solution:
             uid = _content_uid(solution)
             name = f"{rnd:02d}-{gen_num}-generate-{model}-solution-{uid}.md"
-            _archive_artifact(arena_dir, name, solution)
+            _archive_artifact(prefix + name, solution)
 
         analysis = state.analyses.get(alias)
         if analysis:
             uid = _content_uid(analysis)
             name = f"{rnd:02d}-{gen_num}-generate-{model}-analysis-{uid}.md"
-            _archive_artifact(arena_dir, name, analysis)
+            _archive_artifact(prefix + name, analysis)
 
         critique = state.critiques.get(alias)
         if critique:
             uid = _content_uid(critique)
-            eval_num = PHASE_NUMBERS["evaluate"]
             name = f"{rnd:02d}-{eval_num}-evaluate-{model}-critique-{uid}.md"
-            _archive_artifact(arena_dir, name, critique)
+            _archive_artifact(prefix + name, critique)
 
         # Archive per-agent verdict
         votes = state.verify_votes.get(alias)
@@ -169,9 +220,8 @@ def _archive_round(state: ArenaState, arena_dir: str) -> None:
             }
             verdict_json = json.dumps(verdict_data, indent=2)
             uid = _content_uid(verdict_json)
-            eval_num = PHASE_NUMBERS["evaluate"]
             name = f"{rnd:02d}-{eval_num}-evaluate-{model}-verdict-{uid}.json"
-            _archive_artifact(arena_dir, name, verdict_json)
+            _archive_artifact(prefix + name, verdict_json)
 
 
 def _archive_filename(
@@ -253,16 +303,23 @@ def update_report(state: ArenaState, arena_dir: str) -> None:
     if state.verify_winner:
         winner_model = state.alias_mapping.get(state.verify_winner, "unknown")
         lines.append(f"**Winner:** {state.verify_winner} ({winner_model})")
-    lines += ["", "### Agents", ""]
-    lines.append("| Alias | Model |")
-    lines.append("|-------|-------|")
-    for alias in state.alias_mapping:
-        model = state.alias_mapping.get(alias, "unknown")
-        lines.append(f"| {alias} | {model} |")
+    lines += ["", "### Agents", "", "| Alias | Model |", "|-------|-------|"]
+    lines += [
+        f"| {alias} | {state.alias_mapping.get(alias, 'unknown')} |"
+        for alias in state.alias_mapping
+    ]
     lines += ["", "---", ""]
 
     # ── Per-round sections (built from verdict_history) ──
     prev_tokens: dict[str, int] = {}
+    # _mermaid_vote_graph only reads the mapping, so build the alias list
+    # once and pass the mapping itself rather than copying both per round.
+    aliases = list(state.alias_mapping)
+    # Sanitized model names for archive links don't change between rounds.
+    safe_models = {
+        alias: sanitize_filename_component(str(model))
+        for alias, model in state.alias_mapping.items()
+    }
 
     for rnd_idx, vh_json in enumerate(state.verdict_history):
         try:
@@ -286,17 +343,20 @@ def update_report(state: ArenaState, arena_dir: str) -> None:
             if cur > 0:
                 token_deltas[alias] = cur - prev
 
-        lines.append(f"## Round {rnd_idx}")
-        lines.append("")
+        lines += [f"## Round {rnd_idx}", ""]
 
         # Score/vote table (include token delta column if data exists)
         has_tokens = bool(token_deltas)
         if has_tokens:
-            lines.append("| Agent | Model | Score | Voted for | Divergences | Tokens |")
-            lines.append("|-------|-------|------:|-----------|-------------|-------:|")
+            lines += [
+                "| Agent | Model | Score | Voted for | Divergences | Tokens |",
+                "|-------|-------|------:|-----------|-------------|-------:|",
+            ]
         else:
-            lines.append("| Agent | Model | Score | Voted for | Divergences |")
-            lines.append("|-------|-------|------:|-----------|-------------|")
+            lines += [
+                "| Agent | Model | Score | Voted for | Divergences |",
+                "|-------|-------|------:|-----------|-------------|",
+            ]
         for alias in state.alias_mapping:
             model = str(state.alias_mapping.get(alias, "unknown"))
             score = rnd_scores.get(alias, "—")
@@ -311,16 +371,12 @@ def update_report(state: ArenaState, arena_dir: str) -> None:
                 )
             else:
                 lines.append(f"| {alias} | {model} | {score} | {votes} | {div_count} |")
-        lines.append("")
-        lines.append(f"**Min score:** {final_score}")
-        lines.append("")
+        lines += ["", f"**Min score:** {final_score}", ""]
 
         # Mermaid vote diagram
-        aliases = list(state.alias_mapping.keys())
-        mermaid_lines = _mermaid_vote_graph(
-            aliases, dict(state.alias_mapping), rnd_scores, rnd_votes
+        lines += _mermaid_vote_graph(
+            aliases, state.alias_mapping, rnd_scores, rnd_votes
         )
-        lines.extend(mermaid_lines)
         lines.append("")
 
         # Carry forward token snapshot for next round's delta
@@ -328,33 +384,22 @@ def update_report(state: ArenaState, arena_dir: str) -> None:
             prev_tokens = dict(rnd_tokens)
 
         # Divergence details (if any)
-        all_divs = [
-            (alias, d)
-            for alias in state.alias_mapping
-            for d in (
-                rnd_divergences.get(alias, [])
-                if isinstance(rnd_divergences.get(alias), list)
-                else []
-            )
-        ]
+        all_divs: list[tuple[str, object]] = []
+        for alias in state.alias_mapping:
+            alias_divs = rnd_divergences.get(alias)
+            if isinstance(alias_divs, list) and alias_divs:
+                all_divs.extend((alias, d) for d in alias_divs)
         if all_divs:
-            lines.append("<details><summary>Divergences</summary>")
-            lines.append("")
+            lines += ["<details><summary>Divergences</summary>", ""]
             for alias, d in all_divs:
                 topic = d.get("topic", "?") if isinstance(d, dict) else "?"
                 desc = d.get("description", "") if isinstance(d, dict) else str(d)
                 lines.append(f"- **{alias}** — *{topic}*: {desc}")
-            lines.append("")
-            lines.append("</details>")
-            lines.append("")
+            lines += ["", "</details>", ""]
 
         # Archive file links
-        lines.append("<details><summary>Archived files</summary>")
-        lines.append("")
-        for alias in state.alias_mapping:
-            model_san = sanitize_filename_component(
-                str(state.alias_mapping.get(alias, "unknown"))
-            )
+        lines += ["<details><summary>Archived files</summary>", ""]
+        for alias, model_san in safe_models.items():
             gen_phase = "generate"
 
             link_parts: list[str] = []
@@ -399,17 +444,12 @@ def update_report(state: ArenaState, arena_dir: str) -> None:
                 links = " · ".join(link_parts)
                 lines.append(f"- **{alias}** ({model_san}): {links}")
 
-        lines.append("")
-        lines.append("</details>")
-        lines.append("")
-        lines.append("---")
-        lines.append("")
+        lines += ["", "</details>", "", "---", ""]
 
     # ── Current voting results (for the live/latest round) ──
     if state.verify_scores and not state.verdict_history:
         # Edge case: scores exist but no verdict_history entry yet
-        lines.append("## Current Voting")
-        lines.append("")
+        lines += ["## Current Voting", ""]
         for alias in state.alias_mapping:
             model = state.alias_mapping.get(alias, "unknown")
             cur_score = state.verify_scores.get(alias, "—")
@@ -417,9 +457,7 @@ def update_report(state: ArenaState, arena_dir: str) -> None:
             lines.append(
                 f"- **{alias}** ({model}): score={cur_score}, voted for {cur_votes}"
             )
-        lines.append("")
-        lines.append("---")
-        lines.append("")
+        lines += ["", "---", ""]
 
     # ── PR link ──
     if state.consensus_reached and state.branch_names and state.verify_winner:
@@ -433,10 +471,7 @@ def update_report(state: ArenaState, arena_dir: str) -> None:
             pr_url = (
                 f"{repo_url}/compare/{state.config.base_branch}...{branch}?expand=1"
             )
-            lines.append(f"**[Create PR for winner]({pr_url})**")
-            lines.append("")
-            lines.append("---")
-            lines.append("")
+            lines += [f"**[Create PR for winner]({pr_url})**", "", "---", ""]
 
     # ── Token usage ──
     if state.token_usage:
@@ -446,8 +481,7 @@ def update_report(state: ArenaState, arena_dir: str) -> None:
             "gpt": 0.060,
             "gemini": 0.035,
         }
-        lines.append("## Token Usage")
-        lines.append("")
+        lines += ["## Token Usage", ""]
         total_cost = 0.0
         for alias, tokens in state.token_usage.items():
             model = str(state.alias_mapping.get(alias, "unknown"))
@@ -462,9 +496,10 @@ def update_report(state: ArenaState, arena_dir: str) -> None:
         lines.append("")
 
     report_path = os.path.join(arena_dir, "report.md")
-    with open(report_path, "w") as f:
-        f.write("\n".join(lines))
-    logger.info("Report updated: %s", report_path)
+    if _write_if_changed(report_path, "\n".join(lines)):
+        logger.info("Report updated: %s", report_path)
+    else:
+        logger.debug("Report unchanged: %s", report_path)
 
 
 # ---------------------------------------------------------------------------
@@ -512,8 +547,7 @@ def _write_winning_solution(state: ArenaState, arena_dir: str) -> None:
         lines += ["---", "", "## Analysis", "", analysis, ""]
 
     path = os.path.join(arena_dir, "winning-solution.md")
-    with open(path, "w") as f:
-        f.write("\n".join(lines))
+    _write_if_changed(path, "\n".join(lines))
     logger.info("Winning solution written to %s", path)
 
 
@@ -651,8 +685,15 @@ def deliver_pending_comments(
     return delivered
 
 
-def step_once(arena_dir: str = ARENAS_ROOT) -> ArenaState:
-    """Execute exactly one phase transition and return the updated state."""
+def step_once(
+    arena_dir: str = ARENAS_ROOT, api: CursorCloudAPI | None = None
+) -> ArenaState:
+    """Execute exactly one phase transition and return the updated state.
+
+    *api* lets a caller that steps repeatedly reuse one client (and its
+    pooled HTTP connections); when omitted, one is built from the
+    environment via :func:`_make_api`.
+    """
     state_path = os.path.join(arena_dir, "state.yaml")
     state = load_state(state_path)
     if state is None:
@@ -668,7 +709,8 @@ def step_once(arena_dir: str = ARENAS_ROOT) -> ArenaState:
     if handler is None:
         raise ValueError(f"Unknown or terminal phase: {before_phase}")
 
-    api = _make_api()
+    if api is None:
+        api = _make_api()
 
     # Deliver any queued operator comments before the phase runs
     deliver_pending_comments(state, arena_dir, api)
@@ -692,8 +734,9 @@ def step_once(arena_dir: str = ARENAS_ROOT) -> ArenaState:
 
 def run_orchestrator(arena_dir: str = ARENAS_ROOT) -> None:
     """Loop :func:`step_once` until the arena is complete, then report."""
+    api = _make_api()
     while True:
-        state = step_once(arena_dir)
+        state = step_once(arena_dir, api=api)
         if state.completed:
             break
 
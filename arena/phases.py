@@ -15,9 +15,11 @@ from __future__ import annotations
 import json
 import logging
 import os
+import random
 import time
 from collections import Counter
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 
 from arena.api import (
     CursorCloudAPI,
@@ -39,6 +41,7 @@ from arena.state import (
     ArenaState,
     Phase,
     ProgressStatus,
+    _write_if_changed,
     expected_path,
     resolve_model,
     save_state,
@@ -46,6 +49,9 @@ from arena.state import (
 
 logger = logging.getLogger("arena")
 
+FETCH_RETRY_BASE_DELAY = 5.0  # seconds before the first re-fetch
+FETCH_RETRY_MAX_DELAY = 60.0  # cap on the exponential backoff
+
 
 def agent_label(alias: str, state: ArenaState) -> str:
     """Return a human-readable label like ``agent_a (opus)`` for log messages."""
@@ -57,18 +63,13 @@ def agent_label(alias: str, state: ArenaState) -> str:
 
 def _record_timing_start(state: ArenaState, alias: str, phase_name: str) -> None:
     """Record the start time for an agent's phase."""
-    if alias not in state.agent_timing:
-        state.agent_timing[alias] = {}
-    state.agent_timing[alias][phase_name] = {"start": time.time()}
+    state.agent_timing.setdefault(alias, {})[phase_name] = {"start": time.time()}
 
 
 def _record_timing_end(state: ArenaState, alias: str, phase_name: str) -> None:
     """Record the end time for an agent's phase."""
-    if alias not in state.agent_timing:
-        state.agent_timing[alias] = {}
-    entry = state.agent_timing[alias].get(phase_name, {})
-    entry["end"] = time.time()
-    state.agent_timing[alias][phase_name] = entry
+    phases = state.agent_timing.setdefault(alias, {})
+    phases.setdefault(phase_name, {})["end"] = time.time()
 
 
 def _capture_agent_metadata(state: ArenaState, alias: str, api: CursorCloudAPI) -> None:
@@ -92,10 +93,11 @@ def _update_token_usage(
     state: ArenaState, alias: str, conversation: list[dict]
 ) -> None:
     """Update cumulative token usage for *alias* from conversation metadata."""
-    total = 0
-    for msg in conversation:
-        usage = msg.get("usage", {})
-        total += usage.get("total_tokens", 0)
+    total = sum(
+        usage.get("total_tokens", 0)
+        for msg in conversation
+        if (usage := msg.get("usage"))
+    )
     if total > 0:
         state.token_usage[alias] = total
 
@@ -120,19 +122,22 @@ def _save_conversation(
     Writes to ``conversations/{model}.json`` under the arena directory
     (derived from *state_path*), using the model nickname rather than
     the alias.  Overwrites on each call so the file always reflects
-    the latest state of the conversation.
+    the latest state of the conversation; the write is skipped when the
+    file already holds the same transcript (e.g. on crash recovery).
     """
     arena_dir = os.path.dirname(state_path)
     conv_dir = os.path.join(arena_dir, "conversations")
-    os.makedirs(conv_dir, exist_ok=True)
     model = state.alias_mapping.get(alias, alias)
     out_path = os.path.join(conv_dir, f"{model}.json")
     try:
-        with open(out_path, "w") as f:
-            json.dump(conversation, f, indent=2, ensure_ascii=False)
-        logger.debug(
-            "Saved conversation for %s (%d messages)", model, len(conversation)
-        )
+        if _write_if_changed(
+            out_path, json.dumps(conversation, indent=2, ensure_ascii=False)
+        ):
+            logger.debug(
+                "Saved conversation for %s (%d messages)", model, len(conversation)
+            )
+        else:
+            logger.debug("Conversation for %s unchanged", model)
     except OSError:
         logger.warning("Failed to save conversation for %s to %s", model, out_path)
 
@@ -151,6 +156,22 @@ def _fetch_agent_file(state: ArenaState, alias: str, file_path: str) -> str | No
     return fetch_file_from_branch(state.config.repo, branch, file_path)
 
 
+def _fetch_agent_files(
+    state: ArenaState, wanted: list[tuple[str, str]]
+) -> dict[tuple[str, str], str | None]:
+    """Fetch several ``(alias, file_path)`` pairs from agent branches at once.
+
+    Each fetch is an independent ``gh api`` round trip, so they run in a
+    small thread pool.  *state* is only read; callers apply the results
+    on the calling thread.  Missing files map to ``None``.
+    """
+    if not wanted:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(len(wanted), 8)) as pool:
+        contents = pool.map(lambda w: _fetch_agent_file(state, *w), wanted)
+        return dict(zip(wanted, contents))
+
+
 def _fetch_with_retry(
     state: ArenaState,
     alias: str,
@@ -159,16 +180,23 @@ def _fetch_with_retry(
     *,
     commit_desc: str,
     max_retries: int = 3,
+    prefetched_miss: bool = False,
 ) -> str | None:
     """Fetch a file from an agent's branch, re-prompting if missing.
 
-    Retries up to *max_retries* times, sending a follow-up each time
-    asking the agent to commit the expected file.  Returns the file
-    content on success, or ``None`` if all retries are exhausted.
+    Retries up to *max_retries* times.  Each attempt first waits with
+    jittered exponential backoff and re-fetches (the agent's push may
+    simply not be visible yet), and only then sends a follow-up asking
+    the agent to commit the expected file.  Returns the file content on
+    success, or ``None`` if all retries are exhausted.
+
+    Pass *prefetched_miss* when the caller has just fetched the file and
+    found it missing, to skip the redundant opening fetch.
     """
-    content = _fetch_agent_file(state, alias, file_path)
-    if content is not None:
-        return content
+    if not prefetched_miss:
+        content = _fetch_agent_file(state, alias, file_path)
+        if content is not None:
+            return content
 
     branch = state.branch_names.get(alias)
     agent_id = state.agent_ids.get(alias)
@@ -176,6 +204,12 @@ def _fetch_with_retry(
         return None
 
     for attempt in range(1, max_retries + 1):
+        delay = min(FETCH_RETRY_MAX_DELAY, FETCH_RETRY_BASE_DELAY * 2 ** (attempt - 1))
+        time.sleep(delay * random.uniform(0.5, 1.5))
+        content = _fetch_agent_file(state, alias, file_path)
+        if content is not None:
+            return content
+
         logger.warning(
             "File %s not found on %s branch (attempt %d/%d); re-prompting",
             file_path,
@@ -258,10 +292,10 @@ def step_generate(state: ArenaState, api: CursorCloudAPI, *, state_path: str) ->
             for alias in state.alias_mapping
             if state.phase_progress.get(alias) != ProgressStatus.DONE
         }
-        if pending:
-            wait_for_all_agents(api, pending)
+        finished = wait_for_all_agents(api, pending) if pending else {}
 
-        # Capture branch names from the status() response
+        # Capture branch names from the status() response, reusing the
+        # final status the wait loop already fetched where available
         for alias in state.alias_mapping:
             if alias in state.branch_names:
                 continue
@@ -269,13 +303,16 @@ def step_generate(state: ArenaState, api: CursorCloudAPI, *, state_path: str) ->
             if not agent_id:
                 continue
             try:
-                info = api.status(agent_id)
-                branch = info.get("target", {}).get("branchName") or info.get(
-                    "target", {}
-                ).get("branch_name")
-                if branch:
-                    state.branch_names[alias] = branch
-                    logger.info("%s branch: %s", agent_label(alias, state), branch)
+                info = finished.get(alias) or api.status(agent_id)
+                target = info.get("target") or {}
+                status_branch: str | None = target.get("branchName") or target.get(
+                    "branch_name"
+                )
+                if status_branch:
+                    state.branch_names[alias] = status_branch
+                    logger.info(
+                        "%s branch: %s", agent_label(alias, state), status_branch
+                    )
             except Exception:
                 logger.warning(
                     "Failed to fetch branch name for %s", agent_label(alias, state)
@@ -284,11 +321,13 @@ def step_generate(state: ArenaState, api: CursorCloudAPI, *, state_path: str) ->
     else:
         # ── Round > 0: Send follow-ups with critique references ──
         for alias in state.alias_mapping:
-            if state.phase_progress.get(alias) == ProgressStatus.DONE:
+            progress = state.phase_progress.get(alias)
+            if progress == ProgressStatus.DONE:
                 continue
+            agent_id = state.agent_ids[alias]
 
-            if state.phase_progress.get(alias) == ProgressStatus.SENT:
-                current_count = len(api.get_conversation(state.agent_ids[alias]))
+            if progress == ProgressStatus.SENT:
+                current_count = len(api.get_conversation(agent_id))
                 saved_count = state.sent_msg_counts.get(alias, 0)
                 if current_count > saved_count:
                     continue
@@ -297,9 +336,7 @@ def step_generate(state: ArenaState, api: CursorCloudAPI, *, state_path: str) ->
                     agent_label(alias, state),
                 )
             else:
-                state.sent_msg_counts[alias] = len(
-                    api.get_conversation(state.agent_ids[alias])
-                )
+                state.sent_msg_counts[alias] = len(api.get_conversation(agent_id))
                 state.phase_progress[alias] = ProgressStatus.SENT
                 _record_timing_start(state, alias, "generate")
                 _save()
@@ -308,7 +345,7 @@ def step_generate(state: ArenaState, api: CursorCloudAPI, *, state_path: str) ->
                 )
 
             api.followup(
-                agent_id=state.agent_ids[alias],
+                agent_id=agent_id,
                 prompt=generate_prompt(
                     state.config.task,
                     alias,
@@ -328,18 +365,32 @@ def step_generate(state: ArenaState, api: CursorCloudAPI, *, state_path: str) ->
             wait_for_all_followups(api, pending_followups)
 
     # ── Extract solutions from committed branch files ──
-    for alias in state.alias_mapping:
-        if state.phase_progress.get(alias) == ProgressStatus.DONE:
-            continue
-
+    extract = {
+        a: (expected_path(anum, a, "solution"), expected_path(anum, a, "analysis"))
+        for a in state.alias_mapping
+        if state.phase_progress.get(a) != ProgressStatus.DONE
+    }
+    prefetched = _fetch_agent_files(
+        state, [(a, path) for a, paths in extract.items() for path in paths]
+    )
+    for alias, (sol_path, ana_path) in extract.items():
         commit_desc = f"round {rnd:02d} generate {alias}"
-        sol_path = expected_path(anum, alias, "solution")
-        ana_path = expected_path(anum, alias, "analysis")
 
-        solution = _fetch_with_retry(
-            state, alias, sol_path, api, commit_desc=commit_desc
-        )
-        analysis = _fetch_agent_file(state, alias, ana_path)
+        # Only files missing from the concurrent prefetch are retried; the
+        # analysis is re-fetched only if the solution arrived late with it.
+        solution = prefetched[alias, sol_path]
+        analysis = prefetched[alias, ana_path]
+        if solution is None:
+            solution = _fetch_with_retry(
+                state,
+                alias,
+                sol_path,
+                api,
+                commit_desc=commit_desc,
+                prefetched_miss=True,
+            )
+            if analysis is None:
+                analysis = _fetch_agent_file(state, alias, ana_path)
 
         conversation = api.get_conversation(state.agent_ids[alias])
         _update_token_usage(state, alias, conversation)
@@ -390,12 +441,14 @@ def step_evaluate(state: ArenaState, api: CursorCloudAPI, *, state_path: str) ->
 
     # Send follow-ups to all agents
     for alias in state.alias_mapping:
-        if state.phase_progress.get(alias) == ProgressStatus.DONE:
+        progress = state.phase_progress.get(alias)
+        if progress == ProgressStatus.DONE:
             continue
+        agent_id = state.agent_ids[alias]
 
-        if state.phase_progress.get(alias) == ProgressStatus.SENT:
+        if progress == ProgressStatus.SENT:
             # Resume path: re-send if the agent never got the message
-            current_count = len(api.get_conversation(state.agent_ids[alias]))
+            current_count = len(api.get_conversation(agent_id))
             saved_count = state.sent_msg_counts.get(alias, 0)
             if current_count > saved_count:
                 continue  # Agent already received and may have replied
@@ -404,16 +457,14 @@ def step_evaluate(state: ArenaState, api: CursorCloudAPI, *, state_path: str) ->
                 agent_label(alias, state),
             )
         else:
-            state.sent_msg_counts[alias] = len(
-                api.get_conversation(state.agent_ids[alias])
-            )
+            state.sent_msg_counts[alias] = len(api.get_conversation(agent_id))
             state.phase_progress[alias] = ProgressStatus.SENT
             _record_timing_start(state, alias, "evaluate")
             _save()
             logger.info("Sending evaluate follow-up to %s", agent_label(alias, state))
 
         api.followup(
-            agent_id=state.agent_ids[alias],
+            agent_id=agent_id,
             prompt=evaluate_prompt(alias, agent_files, anum, rnd),
         )
 
@@ -427,23 +478,44 @@ def step_evaluate(state: ArenaState, api: CursorCloudAPI, *, state_path: str) ->
         wait_for_all_followups(api, pending)
 
     # Extract critiques and verdicts
-    for alias in state.alias_mapping:
-        if state.phase_progress.get(alias) == ProgressStatus.DONE:
-            continue
-
+    extract = {
+        a: (
+            expected_path(anum, a, "critique"),
+            expected_path(anum, a, "verdict", ext="json"),
+        )
+        for a in state.alias_mapping
+        if state.phase_progress.get(a) != ProgressStatus.DONE
+    }
+    prefetched = _fetch_agent_files(
+        state, [(a, path) for a, paths in extract.items() for path in paths]
+    )
+    valid_aliases = frozenset(state.alias_mapping)
+    for alias, (critique_path, verdict_path) in extract.items():
         commit_desc = f"round {rnd:02d} evaluate {alias}"
-        critique_path = expected_path(anum, alias, "critique")
-        verdict_path = expected_path(anum, alias, "verdict", ext="json")
 
         # ── Critique extraction ──
-        critique = _fetch_with_retry(
-            state, alias, critique_path, api, commit_desc=commit_desc
-        )
+        critique = prefetched[alias, critique_path]
+        if critique is None:
+            critique = _fetch_with_retry(
+                state,
+                alias,
+                critique_path,
+                api,
+                commit_desc=commit_desc,
+                prefetched_miss=True,
+            )
 
         # ── Verdict extraction ──
-        verdict_text = _fetch_with_retry(
-            state, alias, verdict_path, api, commit_desc=commit_desc
-        )
+        verdict_text = prefetched[alias, verdict_path]
+        if verdict_text is None:
+            verdict_text = _fetch_with_retry(
+                state,
+                alias,
+                verdict_path,
+                api,
+                commit_desc=commit_desc,
+                prefetched_miss=True,
+            )
 
         conversation = api.get_conversation(state.agent_ids[alias])
         _update_token_usage(state, alias, conversation)
@@ -464,7 +536,6 @@ def step_evaluate(state: ArenaState, api: CursorCloudAPI, *, state_path: str) ->
                 verdict_path,
             )
 
-        valid_aliases = frozenset(state.alias_mapping)
         verdict = parse_vote_verdict_json(
             verdict_text or "", valid_aliases=valid_aliases
         )
@@ -501,17 +572,13 @@ def step_evaluate(state: ArenaState, api: CursorCloudAPI, *, state_path: str) ->
     final_score = min(scores) if scores else 0
 
     # Tally votes
-    all_votes: list[str] = []
-    for votes in state.verify_votes.values():
-        all_votes.extend(votes)
-    vote_tally = Counter(all_votes)
+    vote_tally = Counter(v for votes in state.verify_votes.values() for v in votes)
 
     # Check for winner: needs N-1 votes (all non-author agents)
-    winner = None
-    for candidate, count in vote_tally.most_common():
-        if count >= n_agents - 1:
-            winner = candidate
-            break
+    winner = next(
+        (c for c, count in vote_tally.most_common() if count >= n_agents - 1),
+        None,
+    )
 
     consensus = final_score >= 9 and winner is not None
 
@@ -553,6 +620,9 @@ def step_evaluate(state: ArenaState, api: CursorCloudAPI, *, state_path: str) ->
                 ):
                     verify_failed = True
                     logger.warning("Verify command '%s' appears to have failed", cmd)
+                    if state.config.verify_mode == "gating":
+                        # The outcome is decided; skip the remaining commands
+                        break
 
             if verify_failed and state.config.verify_mode == "gating":
                 logger.warning(
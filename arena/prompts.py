@@ -2,10 +2,13 @@
 
 All prompts tell the agent its alias and exact file paths to commit.
 Presentation order of other agents' content is shuffled to prevent
-positional bias.
+positional bias.  The shuffle is seeded per recipient, round and phase,
+so a follow-up re-sent during crash recovery is identical to the
+original.
 """
 
 import random
+from collections.abc import Sequence
 
 from arena.state import expected_path
 
@@ -22,6 +25,18 @@ code changes. The arena commit must:
   - be your LAST commit (after any code changes)"""
 
 
+# ---------------------------------------------------------------------------
+# Presentation-order helper
+# ---------------------------------------------------------------------------
+
+
+def _shuffled[T](items: Sequence[T], *seed: object) -> list[T]:
+    """Return a shuffled copy of *items*, deterministic for a given *seed*."""
+    shuffled = list(items)
+    random.Random(":".join(map(str, seed))).shuffle(shuffled)
+    return shuffled
+
+
 # ---------------------------------------------------------------------------
 # Generate phase (phase 1) — initial solve or revision
 # ---------------------------------------------------------------------------
@@ -62,8 +77,9 @@ def generate_prompt(
 
     # Build critiques block (empty for round 0)
     if agent_critique_files:
-        shuffled = list(agent_critique_files)
-        random.shuffle(shuffled)
+        shuffled = _shuffled(
+            agent_critique_files, arena_number, round_num, "generate", alias
+        )
         ref_blocks = []
         for crit_alias, branch, crit_path in shuffled:
             label = crit_alias.replace("_", " ").upper()
@@ -167,8 +183,7 @@ def evaluate_prompt(
         List of (alias, branch, solution_path, analysis_path) tuples
         for ALL agents.
     """
-    shuffled = list(agent_files)
-    random.shuffle(shuffled)
+    shuffled = _shuffled(agent_files, arena_number, round_num, "evaluate", alias)
 
     ref_blocks = []
     for ref_alias, branch, sol_path, ana_path in shuffled:
@@ -11,11 +11,13 @@ State machine:  Generate -> Evaluate -> Done   (if consensus)
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import os
 import random
 import re
+import stat
 import tempfile
 from enum import StrEnum
 from io import StringIO
@@ -234,7 +236,7 @@ def _resolve_file_ref(value: str, base_dir: str) -> str:
             logger.warning("Path traversal blocked: %s", rel)
             return ""
         if resolved_path.exists():
-            return resolved_path.read_text()
+            return resolved_path.read_text(encoding="utf-8")
         logger.warning(
             "Externalized file %s not found; using empty string", resolved_path
         )
@@ -242,15 +244,47 @@ def _resolve_file_ref(value: str, base_dir: str) -> str:
     return value
 
 
-def _write_artifact(content: str, artifact_path: str) -> None:
-    """Atomically write artifact content to disk (temp + rename)."""
-    parent = os.path.dirname(artifact_path)
-    os.makedirs(parent, exist_ok=True)
-    fd, tmp = tempfile.mkstemp(dir=parent, suffix=".tmp")
+@functools.lru_cache(maxsize=1)
+def _umask() -> int:
+    """Return the process umask (``os.umask`` can only be read by setting it)."""
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+def _write_if_changed(path: str, content: str) -> bool:
+    """Atomically write *content* to *path* unless it already holds exactly that.
+
+    The text is encoded to UTF-8 once and compared/written as bytes.  The
+    write goes to a temp file in the same directory that is then renamed
+    over *path*, so a crash never leaves a truncated file.  The result
+    keeps the mode of the file it replaces, or gets the usual ``0o666``
+    minus umask when new (``mkstemp`` alone would make it owner-only).
+    The parent directory is created the first time it is found missing.
+    Returns ``True`` if the file was written.
+    """
+    data = content.encode("utf-8")
+    mode: int | None = None
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+            mode = stat.S_IMODE(os.fstat(f.fileno()).st_mode)
+    except OSError:
+        pass
+    if mode is None:
+        mode = 0o666 & ~_umask()
+    parent = os.path.dirname(path) or "."
     try:
-        with os.fdopen(fd, "w") as f:
-            f.write(content)
-        os.replace(tmp, artifact_path)
+        fd, tmp = tempfile.mkstemp(dir=parent, suffix=".tmp")
+    except FileNotFoundError:
+        os.makedirs(parent, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            os.fchmod(f.fileno(), mode)
+            f.write(data)
+        os.replace(tmp, path)
     except BaseException:
         try:
             os.unlink(tmp)
@@ -258,13 +292,25 @@ def _write_artifact(content: str, artifact_path: str) -> None:
             # Best-effort cleanup: ignore errors when deleting the temp file.
             pass
         raise
+    return True
+
 
+def _write_artifact(content: str, artifact_path: str) -> None:
+    """Atomically write artifact content to disk (temp + rename).
+
+    Skipped when the file already holds *content*.
+    """
+    _write_if_changed(artifact_path, content)
 
+
+@functools.lru_cache(maxsize=256)
 def sanitize_filename_component(name: str) -> str:
     """Sanitize a string for safe use as a filename component.
 
     Replaces path separators, ``..``, and other unsafe characters with
-    underscores.  Returns ``"_"`` if the result would be empty.
+    underscores.  Returns ``"_"`` if the result would be empty.  Results
+    are memoized: callers pass the same handful of aliases and model
+    names on every step.
     """
     # Replace path separators and null bytes
     sanitized = re.sub(r"[/\\:\x00]", "_", name)
@@ -336,7 +382,7 @@ def load_state(path: str = "arena/state.yaml") -> ArenaState | None:
 
     base_dir = os.path.dirname(actual_path) or "."
 
-    with open(actual_path) as f:
+    with open(actual_path, encoding="utf-8") as f:
         raw = f.read()
 
     # Detect format by extension or content
@@ -361,7 +407,8 @@ def save_state(state: ArenaState, path: str = "arena/state.yaml") -> None:
 
     Large text fields are externalized to separate ``.md`` files under an
     ``artifacts/`` subdirectory.  The state file stores ``file:`` references
-    instead of inline text.
+    instead of inline text.  Files whose content is unchanged are not
+    rewritten.
     """
     parent = os.path.dirname(path) or "."
     os.makedirs(parent, exist_ok=True)
@@ -411,17 +458,8 @@ def save_state(state: ArenaState, path: str = "arena/state.yaml") -> None:
         yaml.dump(dump, stream)
         serialized = stream.getvalue()
 
-    fd, tmp_path = tempfile.mkstemp(dir=parent, suffix=".tmp")
-    try:
-        with os.fdopen(fd, "w") as f:
-            f.write(serialized)
-        os.replace(tmp_path, path)
-    except BaseException:
-        try:
-            os.unlink(tmp_path)
-        except OSError:
-            pass
-        raise
+    # Temp file + rename; an unchanged state (e.g. a no-op retry) is left as is.
+    _write_if_changed(path, serialized)
 
 
 # ---------------------------------------------------------------------------
@@ -55,3 +55,23 @@ class TestCursorCloudAPIInit:
         call_kwargs = api.session.request.call_args
         body = call_kwargs.kwargs.get("json") or call_kwargs[1].get("json")
         assert body["source"]["repository"] == "https://github.com/custom/repo"
+
+
+class TestGetConversation:
+    def test_conversation_uses_etag(self) -> None:
+        """get_conversation() reuses cached messages on 304 Not Modified."""
+        from unittest.mock import MagicMock
+
+        api = CursorCloudAPI("test-key")
+        messages = [{"type": "assistant_message", "text": "hi"}]
+        first = MagicMock(status_code=200, headers={"ETag": '"v1"'})
+        first.json.return_value = {"messages": messages}
+        not_modified = MagicMock(status_code=304, headers={"ETag": '"v1"'})
+
+        api.session.request = MagicMock(side_effect=[first, not_modified])  # type: ignore[assignment]
+        assert api.get_conversation("agent-1") == messages
+        assert api.get_conversation("agent-1") == messages
+        first_call, second_call = api.session.request.call_args_list
+        assert first_call.kwargs["headers"] is None
+        assert second_call.kwargs["headers"] == {"If-None-Match": '"v1"'}
+        not_modified.json.assert_not_called()
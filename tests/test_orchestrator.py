@@ -7,6 +7,7 @@ from unittest.mock import MagicMock, patch
 
 from arena.orchestrator import (
     PENDING_COMMENTS_FILE,
+    _archive_artifact,
     _archive_round,
     _mermaid_vote_graph,
     _write_winning_solution,
@@ -127,6 +128,44 @@ class TestUpdateReport:
             assert "[critique](" in content
             assert "[verdict](" in content
 
+    def test_unchanged_report_not_rewritten(self) -> None:
+        state = init_state(task="test", repo="r")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            update_report(state, tmpdir)
+            report_path = os.path.join(tmpdir, "report.md")
+            os.utime(report_path, (0, 0))
+            update_report(state, tmpdir)
+            assert os.path.getmtime(report_path) == 0
+
+            state.round = 1
+            update_report(state, tmpdir)
+            assert os.path.getmtime(report_path) != 0
+
+    def test_report_lists_divergence_details(self) -> None:
+        state = init_state(task="test", repo="r")
+        state.verdict_history = [
+            json.dumps(
+                {
+                    "votes": {},
+                    "scores": {"agent_a": 7},
+                    "divergences": {
+                        "agent_a": [{"topic": "caching", "description": "TTL"}],
+                        "agent_b": "not a list",
+                        "agent_c": [],
+                    },
+                }
+            ),
+        ]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            update_report(state, tmpdir)
+            with open(os.path.join(tmpdir, "report.md")) as f:
+                content = f.read()
+            assert "<details><summary>Divergences</summary>" in content
+            assert "- **agent_a** — *caching*: TTL" in content
+            assert "**agent_b** —" not in content
+
     def test_report_shows_winner(self) -> None:
         state = init_state(task="test", repo="r")
         state.verify_winner = "agent_a"
@@ -453,6 +492,35 @@ class TestArchiveRound:
             ]
             assert files == []
 
+    def test_creates_missing_arena_dir(self) -> None:
+        state = init_state(task="test", repo="r")
+        state.solutions = {"agent_a": "Sol A"}
+        state.analyses = {}
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            arena_dir = os.path.join(tmpdir, "0001")
+            _archive_round(state, arena_dir)
+            assert len(os.listdir(arena_dir)) == 1
+
+    def test_existing_archive_not_overwritten(self) -> None:
+        state = init_state(task="test", repo="r")
+        state.solutions = {"agent_a": "Sol A"}
+        state.analyses = {}
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            _archive_round(state, tmpdir)
+            (name,) = os.listdir(tmpdir)
+            with open(os.path.join(tmpdir, name), "w") as f:
+                f.write("edited")
+            _archive_round(state, tmpdir)
+            with open(os.path.join(tmpdir, name)) as f:
+                assert f.read() == "edited"
+
+    def test_empty_artifact_not_written(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            _archive_artifact(os.path.join(tmpdir, "sub", "empty.md"), "")
+            assert os.listdir(tmpdir) == []
+
     def test_archive_deduplication(self) -> None:
         """Archiving the same content twice should not create duplicate files."""
         state = init_state(task="test", repo="r")
@@ -530,6 +598,27 @@ class TestStepOnce:
             assert result.phase == Phase.EVALUATE
             assert len(result.agent_ids) == 3
 
+    def test_uses_supplied_api(self) -> None:
+        """A caller-provided API client is used instead of building one."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state = init_state(task="test", repo="owner/repo")
+            save_state(state, os.path.join(tmpdir, "state.yaml"))
+
+            mock_api = MagicMock()
+            ids = iter(["id-1", "id-2", "id-3"])
+            mock_api.launch.side_effect = lambda **kw: {"id": next(ids)}
+            mock_api.status.return_value = {"status": "FINISHED"}
+            mock_api.get_conversation.return_value = []
+
+            with (
+                patch("arena.orchestrator._make_api", side_effect=AssertionError),
+                patch("arena.phases.fetch_file_from_branch", return_value=None),
+            ):
+                result = step_once(arena_dir=tmpdir, api=mock_api)
+
+            assert result.phase == Phase.EVALUATE
+            assert mock_api.launch.call_count == 3
+
 
 class TestArenaDirectoryNumbering:
     def test_next_arena_dir_starts_at_0001(self) -> None:
@@ -595,6 +684,15 @@ class TestArenaDirectoryNumbering:
             os.makedirs(os.path.join(root, "0002"))
             assert latest_arena_dir(root) == os.path.join(root, "0003")
 
+    def test_latest_arena_dir_ignores_numeric_files(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = os.path.join(tmpdir, "arenas")
+            os.makedirs(os.path.join(root, "0001"))
+            with open(os.path.join(root, "0009"), "w") as f:
+                f.write("not a directory\n")
+            assert latest_arena_dir(root) == os.path.join(root, "0001")
+            assert next_arena_dir(root) == os.path.join(root, "0002")
+
 
 class TestDeliverPendingComments:
     """Tests for the sidecar comment pickup logic."""
@@ -5,16 +5,19 @@ without making real API calls.
 """
 
 import json
+import stat
 import tempfile
 import os
 
 from unittest.mock import MagicMock, patch
 
 from arena.phases import (
+    _save_conversation,
+    _update_token_usage,
     step_evaluate,
     step_generate,
 )
-from arena.state import ArenaState, Phase, ProgressStatus, init_state
+from arena.state import ArenaState, Phase, ProgressStatus, _umask, init_state
 
 
 def make_mock_api(
@@ -159,6 +162,28 @@ class TestStepGenerateInitial:
             assert alias in state.solutions
             assert alias in state.analyses
 
+    @patch("arena.phases.fetch_file_from_branch")
+    def test_missing_analysis_not_refetched(self, mock_fetch: MagicMock) -> None:
+        """Without a late solution, a missing analysis is not fetched again."""
+        files = _branch_file_mock().side_effect
+
+        def _fetch(repo: str, branch: str, path: str, **kw: object) -> str | None:
+            if path.endswith("-analysis.md"):
+                return None
+            return files(repo, branch, path, **kw)
+
+        mock_fetch.side_effect = _fetch
+        state = init_state(task="test task", repo="owner/repo")
+        _add_branch_names(state)
+        api = make_mock_api()
+        ids = iter(["id-1", "id-2", "id-3"])
+        api.launch.side_effect = lambda **kw: {"id": next(ids)}
+
+        step_generate(state, api, state_path=_tmp_state_path())
+
+        assert mock_fetch.call_count == 6
+        assert all(state.solutions.values())
+
     @patch("arena.phases.fetch_file_from_branch", return_value=None)
     def test_skips_already_done_agents(self, _mock_fetch: MagicMock) -> None:
         state = init_state(task="test", repo="r")
@@ -189,6 +214,7 @@ class TestStepGenerateInitial:
         for alias in state.alias_mapping:
             assert state.phase_progress[alias] == ProgressStatus.PENDING
 
+    @patch("arena.phases.FETCH_RETRY_BASE_DELAY", 0.0)
     @patch("arena.phases.fetch_file_from_branch", return_value=None)
     def test_captures_branch_names_from_status(self, _mock_fetch: MagicMock) -> None:
         """After generate, branch names are extracted from status() responses."""
@@ -212,6 +238,25 @@ class TestStepGenerateInitial:
             assert alias in state.branch_names
             assert state.branch_names[alias].startswith("cursor/branch-")
 
+    @patch("arena.phases.fetch_file_from_branch")
+    def test_branch_names_reuse_final_wait_status(self, mock_fetch: MagicMock) -> None:
+        mock_fetch.side_effect = _branch_file_mock().side_effect
+        state = init_state(task="test", repo="owner/repo")
+        ids = iter(["id-1", "id-2", "id-3"])
+        api = make_mock_api()
+        api.launch.side_effect = lambda **kw: {"id": next(ids)}
+        api.status.side_effect = lambda agent_id: {
+            "status": "FINISHED",
+            "target": {"branchName": f"cursor/branch-{agent_id}"},
+        }
+
+        step_generate(state, api, state_path=_tmp_state_path())
+
+        assert state.branch_names["agent_a"] == "cursor/branch-id-1"
+        # One final status per agent in the wait loop, one per agent for
+        # metadata; no separate branch-name lookups.
+        assert api.status.call_count == 6
+
 
 class TestStepEvaluate:
     def _make_solved_state(self) -> ArenaState:
@@ -241,6 +286,72 @@ class TestStepEvaluate:
         # state; verify the transition happened correctly instead.
         assert state.phase == Phase.GENERATE
 
+    @patch("arena.phases.fetch_file_from_branch")
+    def test_gating_stops_at_first_failed_verify_command(
+        self, mock_fetch: MagicMock
+    ) -> None:
+        mock_fetch.side_effect = _branch_file_mock(
+            verdict_json=_make_vote_json(score=10, best=["agent_a"])
+        ).side_effect
+        state = self._make_solved_state()
+        state.config = state.config.model_copy(
+            update={
+                "verify_commands": ["pytest", "ruff check"],
+                "verify_mode": "gating",
+            }
+        )
+        api = make_mock_api(
+            [{"role": "assistant", "content": "pytest: 2 tests FAILED"}]
+        )
+
+        step_evaluate(state, api, state_path=_tmp_state_path())
+
+        assert api.followup.call_count == 4  # 3 evaluate + 1 verify command
+        assert len(state.verify_results) == 1
+        assert not state.completed
+        assert state.phase == Phase.GENERATE
+
+    @patch("arena.phases.time.sleep")
+    @patch("arena.phases.fetch_file_from_branch")
+    def test_late_file_refetched_without_followup(
+        self, mock_fetch: MagicMock, mock_sleep: MagicMock
+    ) -> None:
+        """A file missing on the first fetch is re-fetched after a backoff."""
+        files = _branch_file_mock().side_effect
+        missed: set[str] = set()
+
+        def _fetch(repo: str, branch: str, path: str, **kw: object) -> str | None:
+            # Each critique only becomes visible on its second fetch
+            if path.endswith("-critique.md") and path not in missed:
+                missed.add(path)
+                return None
+            return files(repo, branch, path, **kw)
+
+        mock_fetch.side_effect = _fetch
+        state = self._make_solved_state()
+        api = make_mock_api()
+
+        step_evaluate(state, api, state_path=_tmp_state_path())
+
+        assert api.followup.call_count == 3  # evaluate prompts only
+        assert mock_sleep.call_count == 3
+        assert mock_fetch.call_count == 9  # 6 prefetched + 3 after backoff
+        assert all(state.critiques.values())
+
+    @patch("arena.phases.fetch_file_from_branch")
+    def test_fetches_each_file_once(self, mock_fetch: MagicMock) -> None:
+        mock_fetch.side_effect = _branch_file_mock().side_effect
+        state = self._make_solved_state()
+        api = make_mock_api()
+
+        step_evaluate(state, api, state_path=_tmp_state_path())
+
+        # One critique + one verdict per agent, fetched concurrently
+        fetched = sorted(c.args[2] for c in mock_fetch.call_args_list)
+        assert len(fetched) == 6
+        assert len(set(fetched)) == 6
+        assert all(state.critiques.values())
+
     @patch("arena.phases.fetch_file_from_branch")
     def test_low_score_transitions_to_generate(self, mock_fetch: MagicMock) -> None:
         """Score < 9 means no consensus -> transitions to GENERATE.
@@ -408,3 +519,57 @@ class TestStepGenerateRevision:
         assert state.phase == Phase.EVALUATE
         for alias in state.alias_mapping:
             assert state.phase_progress[alias] == ProgressStatus.PENDING
+
+
+class TestSaveConversation:
+    def test_unchanged_conversation_not_rewritten(self) -> None:
+        state = init_state(task="test", repo="r")
+        state_path = _tmp_state_path()
+        conversation = [{"type": "assistant_message", "text": "héllo"}]
+        model = state.alias_mapping["agent_a"]
+        out_path = os.path.join(
+            os.path.dirname(state_path), "conversations", f"{model}.json"
+        )
+
+        _save_conversation(state, state_path, "agent_a", conversation)
+        with open(out_path, encoding="utf-8") as f:
+            assert json.load(f) == conversation
+        os.utime(out_path, (0, 0))
+        _save_conversation(state, state_path, "agent_a", conversation)
+        assert os.path.getmtime(out_path) == 0
+
+        conversation.append({"type": "user_message", "text": "more"})
+        _save_conversation(state, state_path, "agent_a", conversation)
+        assert os.path.getmtime(out_path) != 0
+
+    def test_transcript_is_world_readable(self) -> None:
+        """The atomic temp file must not leave transcripts owner-only."""
+        state = init_state(task="test", repo="r")
+        state_path = _tmp_state_path()
+        model = state.alias_mapping["agent_a"]
+        out_path = os.path.join(
+            os.path.dirname(state_path), "conversations", f"{model}.json"
+        )
+        old_umask = os.umask(0o022)
+        _umask.cache_clear()
+        try:
+            _save_conversation(state, state_path, "agent_a", [{"text": "hi"}])
+        finally:
+            os.umask(old_umask)
+            _umask.cache_clear()
+        assert stat.S_IMODE(os.stat(out_path).st_mode) == 0o644
+
+
+class TestUpdateTokenUsage:
+    def test_sums_messages_with_usage(self) -> None:
+        state = init_state(task="test", repo="r")
+        conversation = [
+            {"type": "user_message", "text": "hi"},
+            {"type": "assistant_message", "usage": {"total_tokens": 120}},
+            {"type": "assistant_message", "usage": None},
+            {"type": "assistant_message", "usage": {"total_tokens": 30}},
+        ]
+
+        _update_token_usage(state, "agent_a", conversation)
+
+        assert state.token_usage["agent_a"] == 150
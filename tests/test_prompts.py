@@ -72,6 +72,13 @@ class TestEvaluatePrompt:
         assert "git show" in prompt
         assert "agent_a-solution.md" in prompt
 
+    def test_order_stable_for_resend(self) -> None:
+        """Re-building the prompt (crash-recovery re-send) gives the same text."""
+        files = _make_agent_files()
+        prompts = {evaluate_prompt("agent_c", files, 1, 2) for _ in range(10)}
+        assert len(prompts) == 1
+        assert files == _make_agent_files()  # caller's list is not shuffled
+
     def test_does_not_contain_solution_content(self) -> None:
         """Prompt should reference files, not paste content."""
         prompt = evaluate_prompt("agent_b", _make_agent_files(), 1, 0)
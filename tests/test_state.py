@@ -2,6 +2,7 @@
 
 import json
 import os
+import stat
 import tempfile
 
 from arena.state import (
@@ -13,6 +14,8 @@ from arena.state import (
     Phase,
     ProgressStatus,
     _aliases_for_count,
+    _umask,
+    _write_if_changed,
     expected_path,
     init_state,
     load_state,
@@ -252,6 +255,24 @@ class TestSaveAndLoad:
             assert loaded is not None
             assert loaded.config.task == "fallback test"
 
+    def test_unchanged_state_not_rewritten(self) -> None:
+        state = init_state(task="test", repo="r")
+        state.solutions = {"agent_a": "Sol A"}
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "state.yaml")
+            artifact = os.path.join(tmpdir, "artifacts", "solutions_agent_a.md")
+            save_state(state, path)
+            os.utime(path, (0, 0))
+            os.utime(artifact, (0, 0))
+            save_state(state, path)
+            assert os.path.getmtime(path) == 0
+            assert os.path.getmtime(artifact) == 0
+
+            state.round = 1
+            save_state(state, path)
+            assert os.path.getmtime(path) != 0
+            assert os.path.getmtime(artifact) == 0
+
     def test_yaml_multiline_task_uses_literal_block(self) -> None:
         """Multi-line tasks are serialized with YAML literal block scalar (|)."""
         multiline_task = "Line one\nLine two\nLine three"
@@ -283,6 +304,34 @@ class TestSaveAndLoad:
             assert loaded.config.task == "Simple task"
 
 
+class TestWriteIfChanged:
+    def test_writes_only_when_content_differs(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "sub", "report.md")
+            assert _write_if_changed(path, "caf\u00e9")
+            assert not _write_if_changed(path, "caf\u00e9")
+            assert _write_if_changed(path, "tea")
+            with open(path, encoding="utf-8") as f:
+                assert f.read() == "tea"
+            # No temp files are left behind
+            assert os.listdir(os.path.dirname(path)) == ["report.md"]
+
+    def test_file_mode_follows_umask_and_existing_file(self) -> None:
+        old_umask = os.umask(0o022)
+        _umask.cache_clear()
+        try:
+            with tempfile.TemporaryDirectory() as tmpdir:
+                path = os.path.join(tmpdir, "report.md")
+                _write_if_changed(path, "v1")
+                assert stat.S_IMODE(os.stat(path).st_mode) == 0o644
+                os.chmod(path, 0o640)
+                _write_if_changed(path, "v2")
+                assert stat.S_IMODE(os.stat(path).st_mode) == 0o640
+        finally:
+            os.umask(old_umask)
+            _umask.cache_clear()
+
+
 class TestExpectedPath:
     def test_solution(self) -> None:
         path = expected_path(3, "agent_a", "solution")